@@ -173,7 +173,7 @@ def set_ivals(interval, limit):
     Parameters
     ----------
     interval : int
-        number of seconds between each check
+        maximum number of seconds between each check
 
     limit : int
         number of seconds to wait.
@@ -640,6 +640,7 @@ class BaseEnsemble(BaseEstimator):
         verbose = kwargs.pop('verbose', max(self._backend.verbose - 1, 0))
         dtype = kwargs.pop('dtype', self._backend.dtype)
         propagate = kwargs.pop('propagate_features', None)
+        cache_transforms = kwargs.pop('cache_transforms', None)
         shuffle = kwargs.pop('shuffle', self.shuffle)
         random_state = kwargs.pop('random_state', self.random_state)
         rs = kwargs.pop('raise_on_exception', self.raise_on_exception)
@@ -658,7 +659,8 @@ class BaseEnsemble(BaseEstimator):
         lyr = Layer(
             name=name, dtype=dtype, shuffle=shuffle,
             random_state=random_state, verbose=verbose,
-            raise_on_exception=rs, propagate_features=propagate)
+            raise_on_exception=rs, propagate_features=propagate,
+            cache_transforms=cache_transforms)
         lyr.push(group)
         return lyr
 
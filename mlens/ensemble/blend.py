@@ -264,6 +264,14 @@ class BlendEnsemble(BaseEnsemble):
             propagate the first two columns of the input matrix to the output
             matrix.
 
+        cache_transforms : bool, optional
+            whether preprocessing pipelines should cache the transformed
+            training folds and prediction inputs, so that estimators sharing
+            a pipeline do not each re-apply it. Faster when several
+            estimators share a preprocessing case, at the cost of a larger
+            estimation cache. If ``None``, the setting of each transformer
+            is kept.
+
         meta : bool (default = False)
             Whether the layer should be treated as the final meta estimator.
 
@@ -105,6 +105,27 @@ def test_run_wo_folds():
     np.testing.assert_array_equal(pred, G2)
 
 
+def test_run_cache_transforms():
+    """[SuperLearner] 'predict' is unchanged by cached transforms."""
+    for backend in ['threading', 'multiprocessing']:
+        preds = list()
+        for cache in [None, True]:
+            ens = SuperLearner(folds=FOLDS, backend=backend)
+            ens.add(ESTIMATORS, PREPROCESSING, dtype=np.float64,
+                    cache_transforms=cache)
+            ens.add_meta(OLS(), dtype=np.float64)
+
+            ens.fit(X1, y1)
+            preds.append(ens.predict(X1))
+
+            layer = ens._backend.stack[0]
+            assert layer.cache_transforms is cache
+            if cache:
+                assert all([tr.cache_transforms for tr in layer.transformers])
+
+        np.testing.assert_array_equal(preds[0], preds[1])
+
+
 def test_scores_fail():
     """[SuperLearner] test scoring exception handling."""
     np.testing.assert_warns(MetricWarning, ens_f.fit, X1, y1)
@@ -5,6 +5,7 @@
 
 import numpy as np
 from mlens import metrics
+from mlens.metrics.utils import assemble_data
 
 
 y = np.ones(10)
@@ -27,3 +28,19 @@ def test_wape():
     """[Metrics] mape."""
     z = metrics.wape(y, p)
     np.testing.assert_equal(np.array(z), np.array(3.7))
+
+
+def test_assemble_data():
+    """[Metrics] assemble_data: aggregate over folds."""
+    d = [('layer-1/case.est.0.1', {'score': 1.}),
+         ('layer-1/case.est.0.2', {'score': 3.}),
+         ('layer-1/case.est.1.1', {'score': 2.}),
+         ('layer-1/case.est.1.2', {'score': 2.})]
+    data = assemble_data(d)
+    assert data['score-m']['layer-1/case.est--0'] == 2.
+    assert data['score-s']['layer-1/case.est--0'] == 1.
+    assert data['score-m']['layer-1/case.est--1'] == 2.
+    assert data['score-s']['layer-1/case.est--1'] == 0.
+
+    data = assemble_data(d[:2])
+    assert data['score-m']['layer-1/case.est'] == 2.
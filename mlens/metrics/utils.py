@@ -52,6 +52,25 @@ def _split(f, s, a_p='', a_s='', b_p='', b_s='', reverse=False):
     return a, b
 
 
+def _get_name(stem, partitions):
+    """Get the table row name of an entry from its name without fold index"""
+    prefix, name = _split(stem, '/', a_s='/')
+
+    # Names are either est.i or case.est.i
+    splitted = name.split('.')
+    if partitions:
+        name = tuple(splitted)
+
+        if len(name) == 3:
+            name = '%s.%s--%s' % name
+        else:
+            name = '%s--%s' % name
+    else:
+        name = '.'.join(splitted[:-1])
+
+    return '%s%s' % (prefix, name)
+
+
 class Data(_dict):
 
     """Wrapper class around dict to get pretty prints
@@ -226,25 +245,17 @@ def assemble_data(data_list):
     partitions = _get_partitions(data_list)
 
     # Collect scores per preprocessing case and estimator(s)
+    names = dict()
     for name, data_dict in data_list:
         if not data_dict:
             continue
 
-        prefix, name = _split(name, '/', a_s='/')
-
-        # Names are either est.i.j or case.est.i.j
-        splitted = name.split('.')
-        if partitions:
-            name = tuple(splitted[:-1])
-
-            if len(name) == 3:
-                name = '%s.%s--%s' % name
-            else:
-                name = '%s--%s' % name
-        else:
-            name = '.'.join(splitted[:-2])
-
-        name = '%s%s' % (prefix, name)
+        # Entries of an estimator only differ in the fold index: parse the
+        # name once per estimator
+        stem = name.rsplit('.', 1)[0]
+        name = names.get(stem)
+        if name is None:
+            name = names[stem] = _get_name(stem, partitions)
 
         if name not in tmp:
             # Set up data struct for name
@@ -270,8 +281,10 @@ def assemble_data(data_list):
                 # Purge None values from the main est due to no predict times
                 v = [i for i in v if i is not None]
                 if v:
-                    data['%s-m' % k][name] = np.mean(v)
-                    data['%s-s' % k][name] = np.std(v)
+                    # Convert once and reuse the buffer for both statistics
+                    v = np.asarray(v, dtype=np.float64)
+                    data['%s-m' % k][name] = v.mean()
+                    data['%s-s' % k][name] = v.std()
             except Exception as exc:
                 warnings.warn(
                     "Aggregating data for %s failed. Raw data:\n%r\n"
@@ -150,21 +150,33 @@ def check_instances(instances):
 
 
 def make_tansformers(generator, indexer, **kwargs):
-    """Set up generators for the job to be performed"""
+    """Set up generators for the job to be performed
+
+    Empty pipelines are no-ops and are not fitted.
+    """
     transformers = [
         EvalTransformer(estimator=Pipeline(pipeline, return_y=True),
                         name=preprocess_name, indexer=indexer, **kwargs)
-        for preprocess_name, pipeline in generator]
+        for preprocess_name, pipeline in generator if pipeline]
     return transformers
 
 
-def make_learners(generator, indexer, scorer, error_score, **kwargs):
-    """Set up generators for the job to be performed"""
-    learners = [
-        EvalLearner(
+def make_learners(generator, indexer, scorer, error_score, cases=None,
+                  **kwargs):
+    """Set up generators for the job to be performed
+
+    If ``cases`` is given, learners in a preprocessing case not in ``cases``
+    (i.e. with an empty pipeline) are built without preprocessing. The case
+    name is kept as prefix to the learner name.
+    """
+    learners = list()
+    for p_name, l_name, est, i, params in generator:
+        name = '%s.%s' % (l_name, i) if i is not None else l_name
+        if p_name and cases is not None and p_name not in cases:
+            name, p_name = '%s.%s' % (p_name, name), None
+
+        learners.append(EvalLearner(
             estimator=clone(est).set_params(**params),
-            preprocess=p_name, indexer=indexer,
-            name='%s.%s' % (l_name, i) if i is not None else l_name,
-            attr='predict', scorer=scorer, error_score=error_score, **kwargs)
-        for p_name, l_name, est, i, params in generator]
+            preprocess=p_name, indexer=indexer, name=name,
+            attr='predict', scorer=scorer, error_score=error_score, **kwargs))
     return learners
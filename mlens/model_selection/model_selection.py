@@ -19,10 +19,10 @@ from ._base_functions import (parse_key, set_job, cat, check_scorer,
 from ..index import FoldIndex
 from ..parallel import ParallelEvaluation
 from ..parallel.base import BaseBackend, IndexMixin
+from ..parallel._base_functions import dispatch
 from ..metrics import Data, assemble_data
 from ..utils.formatting import _flatten, _check_instances
 from ..utils import print_time, safe_print, assert_correct_format
-from ..externals.joblib import delayed
 from ..externals.sklearn.base import clone
 
 try:
@@ -163,7 +163,6 @@ class BaseEval(IndexMixin, BaseBackend):
     def _run(self, case, parallel, args):
         """Process eval"""
         path = args['dir']
-        _threading = self.backend == 'threading'
 
         if case == 'transformers':
             generator = self._transformers
@@ -172,8 +171,8 @@ class BaseEval(IndexMixin, BaseBackend):
             generator = self._learners
             inp = 'main'
 
-        parallel(delayed(subtask, not _threading)()
-                 for task in generator for subtask in task(args, inp))
+        dispatch(parallel,
+                 (subtask for task in generator for subtask in task(args, inp)))
 
     def _fit(self, X, y, job):
         with ParallelEvaluation(self.backend, self.n_jobs) as manager:
@@ -302,6 +301,7 @@ class Benchmark(BaseEval):
 
         self._learners = make_learners(
             generator, self.indexer, scorer, error_score,
+            cases=[tr.name for tr in self._transformers or []],
             verbose=max(0, self.verbose - 14))
 
         job = set_job(estimators, preprocessing)
@@ -518,8 +518,9 @@ class Evaluator(BaseEval):
                 for i, params in enumerate(self.params[cat(p_name, l_name)])]
 
             self._learners = make_learners(
-                generator, self.indexer, self.scorer,
-                self.error_score, verbose=max(0, self.verbose - 14))
+                generator, self.indexer, self.scorer, self.error_score,
+                cases=[tr.name for tr in self._transformers or []],
+                verbose=max(0, self.verbose - 14))
 
     def _format(self, estimators, param_dicts):
         """Ensure estimator object and param_dict object have right format."""
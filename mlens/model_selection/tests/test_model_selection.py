@@ -116,6 +116,25 @@ def test_w_prep_fit():
     assert evl.results['params']['pr.ols']['offset'] == 4
 
 
+def test_w_prep_empty_case():
+    """[Model Selection] Test empty preprocessing cases are skipped."""
+    evl = Evaluator(mape_scorer, cv=5, shuffle=False, random_state=100)
+
+    evl.fit(X, y,
+            estimators={'pr': [OLS()], 'no': [OLS()]},
+            param_dicts={},
+            preprocessing={'pr': [Scale()], 'no': []})
+
+    assert [tr.name for tr in evl._transformers] == ['pr']
+    for lr in evl._learners:
+        if lr.name.startswith('no.'):
+            assert lr.preprocess is None
+        else:
+            assert lr.preprocess == 'pr'
+
+    assert 'no.ols' in evl.results['test_score-m']
+
+
 def test_w_prep_list_fit():
     """[Model Selection] Test run with preprocessing as list."""
     evl = Evaluator(
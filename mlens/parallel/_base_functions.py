@@ -10,11 +10,29 @@ from __future__ import division
 
 import os
 import warnings
+import threading
+from itertools import islice
+from multiprocessing import cpu_count
+from multiprocessing.pool import ThreadPool
 from scipy.sparse import issparse
 import numpy as np
 
 from ..utils import pickle_load, pickle_save, load as _load
+from ..utils.utils import pickled, pickle
 from ..utils.exceptions import MetricWarning, ParameterChangeWarning
+from ..externals.joblib import delayed
+
+
+# Max number of threads for loading cache entries
+_N_LOAD_THREADS = min(32, cpu_count())
+
+# Min total size of cache entries to load concurrently. Smaller entries are
+# page-cached pickles that unpickle faster than threads can be dispatched.
+_LOAD_THREADS_MIN_NBYTES = 3.2e7
+
+_LOAD_POOL = None
+_LOAD_POOL_PID = None
+_LOAD_POOL_LOCK = threading.Lock()
 
 
 def load(path, name, raise_on_exception=True):
@@ -38,11 +56,29 @@ def load(path, name, raise_on_exception=True):
     return obj
 
 
+def load_cached(path, name):
+    """Utility for loading an optional entry from cache.
+
+    Returns ``None`` if the entry does not exist.
+    """
+    if isinstance(path, str):
+        f = pickled(os.path.join(path, name))
+        if not os.path.exists(f):
+            return None
+        return pickle_load(f)
+    elif isinstance(path, list):
+        for key, obj in path:
+            if key == name:
+                return obj
+        return None
+    raise ValueError("Expected str or list. Got %r" % path)
+
+
 def save(path, name, obj):
     """Utility for saving to cache"""
     if isinstance(path, str):
         f = os.path.join(path, name)
-        pickle_save(obj, f)
+        pickle_save(obj, f, pickle.HIGHEST_PROTOCOL)
     elif isinstance(path, list):
         path.append((name, obj))
 
@@ -50,10 +86,11 @@ def save(path, name, obj):
 def prune_files(path, name):
     """Utility for safely selecting only relevant files"""
     if isinstance(path, str):
-        files = [os.path.join(path, f)
+        prefix = os.path.join(path, '')
+        files = [prefix + f
                  for f in os.listdir(path)
                  if name == '.'.join(f.split('.')[:-3])]
-        files = [pickle_load(f) for f in sorted(files)]
+        files = load_files(sorted(files))
     elif isinstance(path, list):
         files = [tup[1] for tup in sorted(path, key=lambda x: x[0])
                  if name == '.'.join(tup[0].split('.')[:-2])]
@@ -63,6 +100,32 @@ def prune_files(path, name):
     return files
 
 
+def _get_load_pool():
+    """Return the thread pool for loading cache entries, created on first use.
+
+    A pool inherited through a fork has no worker threads and is replaced.
+    """
+    global _LOAD_POOL, _LOAD_POOL_PID
+    with _LOAD_POOL_LOCK:
+        if _LOAD_POOL is None or _LOAD_POOL_PID != os.getpid():
+            _LOAD_POOL = ThreadPool(_N_LOAD_THREADS)
+            _LOAD_POOL_PID = os.getpid()
+        return _LOAD_POOL
+
+
+def load_files(files):
+    """Load a list of cache files, in order.
+
+    Large sets of files are loaded concurrently in a thread pool to overlap
+    disk reads, which release the GIL.
+    """
+    if (min(len(files), _N_LOAD_THREADS) < 2 or
+            sum([os.path.getsize(f) for f in files]) <
+            _LOAD_THREADS_MIN_NBYTES):
+        return [pickle_load(f) for f in files]
+    return _get_load_pool().map(pickle_load, files)
+
+
 def replace(source_files):
     """Utility function to replace empty files list"""
     replace_files = list(source_files)
@@ -148,6 +211,94 @@ def _safe_slice(array, idx):
     return array[idx]
 
 
+# Cache of expanded indexes: the same index is used by every estimator
+# fitted on a given fold.
+_INDEX_CACHE = dict()
+_INDEX_CACHE_SIZE = 128
+_INDEX_CACHE_NBYTES = 1e7
+_INDEX_CACHE_BYTES = 0
+_INDEX_CACHE_LOCK = threading.Lock()
+
+
+def clear_index_cache():
+    """Release row indices cached by :func:`expand_index`"""
+    global _INDEX_CACHE_BYTES
+    with _INDEX_CACHE_LOCK:
+        _INDEX_CACHE.clear()
+        _INDEX_CACHE_BYTES = 0
+
+
+def _merge_ranges(idx):
+    """Merge adjacent ``(start, stop)`` tuples"""
+    out = list()
+    for t0, t1 in idx:
+        if out and out[-1][1] == t0:
+            out[-1] = (out[-1][0], t1)
+        else:
+            out.append((t0, t1))
+    return out
+
+
+def expand_index(idx, r=0):
+    """Build a row index from a tuple of ``(start, stop)`` tuples.
+
+    Adjacent ranges are merged. If a single range remains, a slice is
+    returned so that basic slicing (and hence a view) can be used.
+    Otherwise, an integer array for advanced indexing is returned.
+
+    Parameters
+    ----------
+    idx : tuple
+        tuple of ``(start, stop)`` tuples.
+
+    r : int (default = 0)
+        offset to subtract from each index.
+
+    Returns
+    -------
+    index : slice, array-like
+        a slice or a read-only integer array.
+    """
+    global _INDEX_CACHE_BYTES
+    key = (tuple(idx), r)
+    with _INDEX_CACHE_LOCK:
+        out = _INDEX_CACHE.get(key)
+    if out is not None:
+        return out
+
+    ranges = _merge_ranges(idx)
+    if len(ranges) == 1:
+        t0, t1 = ranges[0]
+        out = slice(t0 - r, t1 - r)
+    else:
+        # Fill a single buffer in-place instead of stacking one arange per
+        # range: the offset of each range is added to a running count
+        out = np.arange(sum([t1 - t0 for t0, t1 in ranges]), dtype=np.intp)
+        i = 0
+        for t0, t1 in ranges:
+            j = i + t1 - t0
+            out[i:j] += t0 - r - i
+            i = j
+        out.flags.writeable = False
+
+    nbytes = getattr(out, 'nbytes', 0)
+    if nbytes > _INDEX_CACHE_NBYTES:
+        return out
+
+    # Bound the cache by number of entries and memory held
+    with _INDEX_CACHE_LOCK:
+        if key in _INDEX_CACHE:
+            return _INDEX_CACHE[key]
+
+        if (len(_INDEX_CACHE) >= _INDEX_CACHE_SIZE or
+                _INDEX_CACHE_BYTES + nbytes > _INDEX_CACHE_NBYTES):
+            _INDEX_CACHE.clear()
+            _INDEX_CACHE_BYTES = 0
+        _INDEX_CACHE[key] = out
+        _INDEX_CACHE_BYTES += nbytes
+    return out
+
+
 def slice_array(x, y, idx, r=0):
     """Build training array index and slice data."""
     if idx == 'all':
@@ -157,26 +308,20 @@ def slice_array(x, y, idx, r=0):
         # Check if the idx is a tuple and if so, whether it can be made
         # into a simple slice
         if isinstance(idx[0], tuple):
-            if len(idx[0]) > 1:
-                # Advanced indexing is required. This will trigger a copy
-                # of the slice in question to be made
-                simple_slice = False
-                idx = np.hstack([np.arange(t0 - r, t1 - r) for t0, t1 in idx])
-                x = _safe_slice(x, idx)
-                y = _safe_slice(y, idx)
-            else:
-                # The tuple is of the form ((a, b),) and can be made
-                # into a simple (a, b) tuple for which basic slicing applies
-                # which allows a view to be returned instead of a copy
-                simple_slice = True
-                idx = idx[0]
+            idx = expand_index(idx, r)
         else:
             # Index tuples of the form (a, b) allows simple slicing
-            simple_slice = True
+            idx = slice(idx[0] - r, idx[1] - r)
 
-        if simple_slice:
-            x = x[slice(idx[0] - r, idx[1] - r)]
-            y = y[slice(idx[0] - r, idx[1] - r)] if y is not None else y
+        if isinstance(idx, slice):
+            # Basic slicing returns a view instead of a copy
+            x = x[idx]
+            y = y[idx] if y is not None else y
+        else:
+            # Advanced indexing is required. This will trigger a copy
+            # of the slice in question to be made
+            x = _safe_slice(x, idx)
+            y = _safe_slice(y, idx)
 
     # Cast as ndarray to avoid passing memmaps to estimators
     if y is not None and isinstance(y, np.memmap):
@@ -201,18 +346,20 @@ def assign_predictions(pred, p, tei, col, n):
         r = n - pred.shape[0]
 
         if isinstance(tei[0], tuple):
-            if len(tei) > 1:
-                idx = np.hstack([np.arange(t0 - r, t1 - r) for t0, t1 in tei])
-            else:
-                tei = tei[0]
-                idx = slice(tei[0] - r, tei[1] - r)
+            tei = _merge_ranges(tei)
         else:
-            idx = slice(tei[0] - r, tei[1] - r)
+            tei = [tei]
 
-        if len(p.shape) == 1:
-            pred[idx, col] = p
-        else:
-            pred[(idx, slice(col, col + p.shape[1]))] = p
+        if len(p.shape) != 1:
+            col = slice(col, col + p.shape[1])
+
+        # Write each contiguous range as a slice to avoid a scatter
+        # through an integer index
+        i = 0
+        for t0, t1 in tei:
+            j = i + t1 - t0
+            pred[t0 - r:t1 - r, col] = p[i:j]
+            i = j
 
 
 def score_predictions(y, p, scorer, name, inst_name):
@@ -315,6 +462,63 @@ def check_params(lpar, rpar):
     return _pass
 
 
+def run_batch(tasks):
+    """Run a batch of tasks in sequence"""
+    for task in tasks:
+        task()
+
+
+def make_batches(tasks, n_jobs):
+    """Split tasks into mini-batches.
+
+    Batches are sized to give each worker roughly four batches, so that
+    cheap tasks share the cost of a dispatch while leaving room for load
+    balancing.
+
+    Parameters
+    ----------
+    tasks : iterable
+        tasks to split into batches.
+
+    n_jobs : int
+        number of workers available.
+
+    Returns
+    -------
+    batches : generator
+        generator of lists of tasks.
+    """
+    tasks = list(tasks)
+    batch_size = max(1, len(tasks) // (4 * max(n_jobs, 1)))
+
+    tasks = iter(tasks)
+    batch = list(islice(tasks, batch_size))
+    while batch:
+        yield batch
+        batch = list(islice(tasks, batch_size))
+
+
+# Bound once: the pickle check of run_batch need not be repeated per batch
+_delayed_run_batch = delayed(run_batch)
+
+
+def dispatch(parallel, tasks):
+    """Dispatch tasks to a Parallel instance in mini-batches.
+
+    Parameters
+    ----------
+    parallel : obj
+        a ``Parallel`` instance.
+
+    tasks : iterable
+        iterable of callable tasks.
+    """
+    # pylint: disable=protected-access
+    n_jobs = parallel._effective_n_jobs()
+    parallel(_delayed_run_batch(batch)
+             for batch in make_batches(tasks, n_jobs))
+
+
 def check_stack(new_items, stack):
     """Check if new items can safely be stacked onto old items"""
     names = [st.name for st in stack]
@@ -26,6 +26,7 @@ from abc import ABCMeta, abstractmethod
 import numpy as np
 from scipy.sparse import issparse, hstack
 
+from ._base_functions import clear_index_cache
 from .. import config
 from ..externals.joblib import Parallel, dump, load
 from ..utils import check_initialized
@@ -34,6 +35,11 @@ from ..utils.exceptions import (ParallelProcessingError,
 from ..externals.sklearn.validation import check_random_state
 
 
+# Arrays below this size are sent to workers directly instead of being
+# memory-mapped (matches joblib's auto-memmapping threshold)
+MMAP_MIN_NBYTES = 1e6
+
+
 ###############################################################################
 def _dtype(a, b=None):
     """Utility for getting a dtype"""
@@ -360,7 +366,7 @@ class BaseProcessor(object):
     __meta_class__ = ABCMeta
 
     __slots__ = ['caller', '__initialized__', '__threading__', 'job',
-                 'n_jobs', 'backend', 'verbose']
+                 'n_jobs', 'backend', 'verbose', '_parallel', '_managed']
 
     @abstractmethod
     def __init__(self, backend=None, n_jobs=None, verbose=None):
@@ -372,9 +378,37 @@ class BaseProcessor(object):
         self.verbose = False if not verbose else verbose
         self.__threading__ = self.backend == 'threading'
 
+        self._parallel = None
+        self._managed = False
+
     def __enter__(self):
+        self._managed = True
         return self
 
+    def _get_parallel(self):
+        """Return a :class:`Parallel` instance with an active worker pool.
+
+        If the processor is used as a context manager, the pool is created
+        on first use and kept alive until
+        :func:`~mlens.parallel.backend.BaseProcessor.clear` is called, so that
+        consecutive jobs run on the same manager share workers. Otherwise,
+        the pool is terminated after each job.
+        """
+        if self._parallel is None:
+            tf = self.job.dir if isinstance(self.job.dir, str) else None
+            self._parallel = Parallel(
+                n_jobs=self.n_jobs, temp_folder=tf, max_nbytes=None,
+                mmap_mode='w+', verbose=self.verbose, backend=self.backend)
+            self._parallel.__enter__()
+        return self._parallel
+
+    def _release_parallel(self, force=False):
+        """Terminate the worker pool unless managed by a context manager"""
+        if self._parallel is not None and (force or not self._managed):
+            parallel = self._parallel
+            self._parallel = None
+            parallel.__exit__(None, None, None)
+
     def initialize(self, job, X, y, path,
                    warm_start=False, return_preds=False, **kwargs):
         """Initialize processing engine.
@@ -448,18 +482,18 @@ class BaseProcessor(object):
             # Dump data in cache
             if self.__threading__:
                 # No need to memmap
-                f = None
                 if isinstance(arr, str):
                     arr = _load(arr)
-            else:
-                f = dump_array(arr, name, job.dir)
+            elif not (isinstance(arr, np.ndarray) and
+                      arr.nbytes < MMAP_MIN_NBYTES):
+                # Small arrays are cheaper to send than to memmap
+                arr = _load_mmap(dump_array(arr, name, job.dir))
 
             # Store data for processing
-            if name == 'y' and arr is not None:
-                job.targets = arr if self.__threading__ else _load_mmap(f)
+            if name == 'y':
+                job.targets = arr
             elif name == 'X':
-                job.predict_in = arr \
-                    if self.__threading__ else _load_mmap(f)
+                job.predict_in = arr
 
         self.job = job
         self.__initialized__ = 1
@@ -468,9 +502,14 @@ class BaseProcessor(object):
 
     def __exit__(self, *args):
         self.clear()
+        self._managed = False
 
     def clear(self):
         """Destroy cache and reset instance job parameters."""
+        # Terminate workers before the cache they may reference is removed
+        self._release_parallel(force=True)
+        clear_index_cache()
+
         # Detach Job instance
         job = self.job
         self.job = None
@@ -707,11 +746,8 @@ class ParallelProcessing(BaseProcessor):
         return_final = out.pop('return_final', False)
         out = list() if return_names else None
 
-        tf = self.job.dir if not isinstance(self.job.dir, list) else None
-        with Parallel(n_jobs=self.n_jobs, temp_folder=tf, max_nbytes=None,
-                      mmap_mode='w+', verbose=self.verbose,
-                      backend=self.backend) as parallel:
-
+        parallel = self._get_parallel()
+        try:
             for task in caller:
                 self.job.clear()
 
@@ -721,6 +757,8 @@ class ParallelProcessing(BaseProcessor):
                     out.append(self.get_preds(dtype=_dtype(task)))
 
                 self.job.update()
+        finally:
+            self._release_parallel()
 
         if return_final:
             out = self.get_preds(dtype=_dtype(task))
@@ -846,11 +884,10 @@ class ParallelEvaluation(BaseProcessor):
             job='fit', X=X, y=y, path=path, split=False, stack=False)
         check_initialized(self)
 
-        # Use context manager to ensure same parallel job during entire process
-        tf = self.job.dir if not isinstance(self.job.dir, list) else None
-        with Parallel(n_jobs=self.n_jobs, temp_folder=tf, max_nbytes=None,
-                      mmap_mode='w+', verbose=self.verbose,
-                      backend=self.backend) as parallel:
-
+        # Use same parallel job during entire process
+        parallel = self._get_parallel()
+        try:
             caller.indexer.fit(self.job.predict_in, self.job.targets, self.job.job)
             caller(parallel, self.job.args(**kwargs), case)
+        finally:
+            self._release_parallel()
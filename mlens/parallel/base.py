@@ -37,6 +37,25 @@ from ..utils.exceptions import ParallelProcessingError
 from ..externals.sklearn.base import clone, BaseEstimator as _BaseEstimator
 
 
+# Cache of setup methods per class
+_SETUP_FUNCS = dict()
+
+
+def _get_setup_funcs(cls):
+    """Return the sorted setup methods of a class and their argument names"""
+    funcs = _SETUP_FUNCS.get(cls)
+    if funcs is None:
+        funcs = list()
+        for name in sorted(dir(cls)):
+            if not name.startswith('_setup_'):
+                continue
+            func = getattr(cls, name)
+            code = getattr(func, '__func__', func).__code__
+            funcs.append((name, code.co_varnames[:code.co_argcount]))
+        _SETUP_FUNCS[cls] = funcs
+    return funcs
+
+
 class ParamMixin(_BaseEstimator, object):
 
     """Parameter Mixin
@@ -267,14 +286,11 @@ class BaseParallel(BaseBackend):
     def setup(self, X, y, job, skip=None, **kwargs):
         """Setup instance for estimation"""
         skip = ['_setup_%s' % s for s in skip] if skip else []
-        funs = [f for f in dir(self)
-                if f.startswith('_setup_') and f not in skip]
-
-        for f in sorted(funs):
-            func = getattr(self, f)
-            args = func.__func__.__code__.co_varnames
+        for f, args in _get_setup_funcs(self.__class__):
+            if f in skip:
+                continue
             fargs = {k: v for k, v in kwargs.items() if k in args}
-            func(X, y, job, **fargs)
+            getattr(self, f)(X, y, job, **fargs)
 
 
 class BaseEstimator(ParamMixin, _BaseEstimator, BaseParallel):
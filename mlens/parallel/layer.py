@@ -13,10 +13,12 @@ Layer module.
 
 from __future__ import division, print_function
 
+from ._base_functions import dispatch
+from ..externals.joblib import Parallel
+from ..externals.joblib._parallel_backends import MultiprocessingBackend
 from .base import OutputMixin, IndexMixin, BaseStacker
 from ..utils import time, print_time, safe_print, format_name
 from ..utils.exceptions import NotFittedError
-from ..externals.joblib import delayed
 from ..metrics import Data
 
 
@@ -59,12 +61,29 @@ class Layer(OutputMixin, IndexMixin, BaseStacker):
     random_state : obj, int, optional
         Random seed number to use for shuffling inputs
 
+    cache_transforms : bool, optional
+        Whether preprocessing pipelines should cache the transformed training
+        set of each fold during fitting, and the transformed input data during
+        prediction. Avoids re-applying a pipeline for every learner that
+        shares it, at the cost of a larger estimation cache. If ``None``
+        (default), each transformer keeps its own setting.
+
+    backend : str, optional
+        backend of the processing manager to override. If ``None``
+        (default), the layer runs on the backend of the manager processing
+        it. If ``'threading'`` and the layer is processed by a
+        multiprocessing manager, the layer runs its estimations on threads.
+        This avoids process overhead for estimators that release the GIL
+        (i.e. most tree ensembles, linear models and numpy-based
+        transformers).
+
     **kwargs : optional
         optional arguments to :class:`BaseParallel`.
     """
 
     def __init__(self, name=None, propagate_features=None, shuffle=False,
-                 random_state=None, verbose=False, stack=None, **kwargs):
+                 random_state=None, verbose=False, stack=None,
+                 cache_transforms=None, backend=None, **kwargs):
         if stack and not isinstance(stack, list):
             if stack.__class__.__name__.lower() == 'group':
                 stack = [stack]
@@ -81,6 +100,10 @@ class Layer(OutputMixin, IndexMixin, BaseStacker):
         self.shuffle = shuffle
         self.random_state = random_state
         self.propagate_features = propagate_features
+        self.cache_transforms = cache_transforms
+
+        # None: inherit the backend of the processing manager
+        self.backend = backend
 
         self.n_feature_prop = 0
         if self.propagate_features:
@@ -116,12 +139,19 @@ class Layer(OutputMixin, IndexMixin, BaseStacker):
                              "Add learners before calling" % self.name)
 
         job = args['job']
-        _threading = self.backend == 'threading'
 
         if job != 'fit' and not self.__fitted__:
             raise NotFittedError(
                 "Layer instance (%s) not fitted." % self.name)
 
+        # pylint: disable=protected-access
+        if self.backend == 'threading' and \
+                isinstance(parallel._backend, MultiprocessingBackend):
+            # Run estimations on threads over the manager's cache
+            with Parallel(n_jobs=parallel.n_jobs, verbose=parallel.verbose,
+                          backend='threading') as _parallel:
+                return self(args, _parallel)
+
         if self.verbose:
             msg = "{:<30}"
             f = "stdout" if self.verbose < 10 else "stderr"
@@ -132,14 +162,19 @@ class Layer(OutputMixin, IndexMixin, BaseStacker):
             t0 = time()
 
         if self.transformers:
+            if self.cache_transforms is not None:
+                for transformer in self.transformers:
+                    transformer.cache_transforms = self.cache_transforms
+
             if self.verbose >= 2:
                 safe_print(msg.format('Preprocess pipelines ...'),
                            file=f, end=e2)
                 t1 = time()
 
-            parallel(delayed(subtransformer, not _threading)()
-                     for transformer in self.transformers
-                     for subtransformer in transformer(args, 'auxiliary'))
+            dispatch(parallel,
+                     (subtransformer
+                      for transformer in self.transformers
+                      for subtransformer in transformer(args, 'auxiliary')))
 
             if self.verbose >= 2:
                 print_time(t1, 'done', file=f)
@@ -148,9 +183,10 @@ class Layer(OutputMixin, IndexMixin, BaseStacker):
             safe_print(msg.format('Learners ...'), file=f, end=e2)
             t1 = time()
 
-        parallel(delayed(sublearner, not _threading)()
-                 for learner in self.learners
-                 for sublearner in learner(args, 'main'))
+        dispatch(parallel,
+                 (sublearner
+                  for learner in self.learners
+                  for sublearner in learner(args, 'main')))
 
         if self.verbose >= 2:
             print_time(t1, 'done', file=f)
@@ -18,7 +18,7 @@ from abc import ABCMeta, abstractmethod
 
 from ._base_functions import (
     slice_array, set_output_columns, assign_predictions, score_predictions,
-    replace, save, load, prune_files, check_params)
+    replace, save, load, load_cached, prune_files, check_params, dispatch)
 from .base import OutputMixin, ProbaMixin, IndexMixin, BaseEstimator
 
 from ..metrics import Data
@@ -27,7 +27,6 @@ from ..utils.exceptions import (NotFittedError, FitFailedWarning,
                                 ParallelProcessingError, NotInitializedError)
 
 from ..externals.sklearn.base import clone
-from ..externals.joblib.parallel import delayed
 try:
     from time import perf_counter as time
 except ImportError:
@@ -40,6 +39,10 @@ ONLY_ALL = ['fullindex', 'nonetype']
 GLOBAL_LEARNER_NAMES = list()
 GLOBAL_TRANSFORMER_NAMES = list()
 
+# Cache prefixes for transformed training and prediction data
+PREPROCESSED = '__x__'
+PREDICT_PREPROCESSED = '__xp__'
+
 
 ###############################################################################
 class IndexedEstimator(object):
@@ -84,6 +87,13 @@ class SubLearner(object):
 
     Wrapper around a sub_learner job.
     """
+    __slots__ = [
+        'job', 'estimator', 'in_index', 'out_index', 'in_array', 'targets',
+        'out_array', 'score_', 'index', 'path', 'attr', 'preprocess',
+        'scorer', 'raise_on_exception', 'verbose', 'output_columns',
+        'fit_time_', 'pred_time_', 'name', 'name_index', 'preprocess_index',
+        'preprocessed_index', 'processing_index']
+
     def __init__(self, job, parent, estimator, in_index, out_index,
                  in_array, targets, out_array, index):
         self.job = job
@@ -111,11 +121,13 @@ class SubLearner(object):
         self.pred_time_ = None
 
         self.name = parent.cache_name
-        self.name_index = '.'.join([self.name] + [str(i) for i in index])
+        suffix = ''.join(['.%s' % i for i in index])
+        self.name_index = self.name + suffix
 
         if self.preprocess is not None:
-            self.preprocess_index = '.'.join(
-                [self.preprocess] + [str(i) for i in index])
+            self.preprocess_index = self.preprocess + suffix
+            prefix = PREPROCESSED if job == 'fit' else PREDICT_PREPROCESSED
+            self.preprocessed_index = prefix + '.' + self.preprocess_index
         else:
             self.processing_index = ''
 
@@ -128,9 +140,15 @@ class SubLearner(object):
         if path is None:
             path = self.path
         t0 = time()
-        transformers = self._load_preprocess(path)
+        preprocessed = self._load_preprocessed(path)
 
-        self._fit(transformers)
+        transformers = None
+        if preprocessed is None or self.out_array is not None:
+            # With a cached training set, the pipeline is only needed to
+            # transform the data to predict
+            transformers = self._load_preprocess(path)
+
+        self._fit(transformers, preprocessed)
 
         if self.out_array is not None:
             self._predict(transformers, self.scorer is not None)
@@ -154,9 +172,12 @@ class SubLearner(object):
         if path is None:
             path = self.path
         t0 = time()
-        transformers = self._load_preprocess(path)
+        preprocessed = self._load_preprocessed(path)
+        transformers = None
+        if preprocessed is None:
+            transformers = self._load_preprocess(path)
 
-        self._predict(transformers, False)
+        self._predict(transformers, False, preprocessed)
         if self.verbose:
             msg = "{:<30} {}".format(self.name_index, "done")
             f = "stdout" if self.verbose < 10 - 3 else "stderr"
@@ -166,14 +187,20 @@ class SubLearner(object):
         """Predict with sublearner"""
         return self.predict(path)
 
-    def _fit(self, transformers):
+    def _fit(self, transformers, preprocessed=None):
         """Sub-routine to fit sub-learner"""
-        xtemp, ytemp = slice_array(self.in_array, self.targets, self.in_index)
+        if preprocessed is not None:
+            # Training set transformed by the preprocessing pipeline
+            xtemp, ytemp = preprocessed
+            t0 = time()
+        else:
+            xtemp, ytemp = slice_array(
+                self.in_array, self.targets, self.in_index)
 
-        # Transform input (triggers copying)
-        t0 = time()
-        if transformers:
-            xtemp, ytemp = transformers.transform(xtemp, ytemp)
+            # Transform input (triggers copying)
+            t0 = time()
+            if transformers:
+                xtemp, ytemp = transformers.transform(xtemp, ytemp)
 
         # Fit estimator
         self.estimator.fit(xtemp, ytemp)
@@ -186,29 +213,42 @@ class SubLearner(object):
             return obj.estimator
         return
 
-    def _predict(self, transformers, score_preds):
+    def _load_preprocessed(self, path):
+        """Load transformed input data if cached by the pipeline"""
+        if self.preprocess is not None:
+            return load_cached(path, self.preprocessed_index)
+        return
+
+    def _predict(self, transformers, score_preds, preprocessed=None):
         """Sub-routine to with sublearner"""
         n = self.in_array.shape[0]
-        # For training, use ytemp to score predictions
-        # During test time, ytemp is None
-        xtemp, ytemp = slice_array(self.in_array, self.targets, self.out_index)
-        t0 = time()
-
-        if transformers:
-            xtemp, ytemp = transformers.transform(xtemp, ytemp)
+        if preprocessed is not None:
+            # Input data transformed by the preprocessing pipeline
+            xtemp, ytemp = preprocessed
+            t0 = time()
+        else:
+            # For training, use ytemp to score predictions
+            # During test time, ytemp is None
+            xtemp, ytemp = slice_array(
+                self.in_array, self.targets, self.out_index)
+            t0 = time()
+
+            if transformers:
+                xtemp, ytemp = transformers.transform(xtemp, ytemp)
         predictions = getattr(self.estimator, self.attr)(xtemp)
 
         self.pred_time_ = time() - t0
 
-        # Assign predictions to matrix
-        assign_predictions(self.out_array, predictions,
-                           self.out_index, self.output_columns, n)
-
-        # Score predictions if applicable
+        # Score predictions if applicable. Scoring before assigning to the
+        # prediction matrix reads predictions while still in cache
         if score_preds:
             self.score_ = score_predictions(
                 ytemp, predictions, self.scorer, self.name_index, self.name)
 
+        # Assign predictions to matrix
+        assign_predictions(self.out_array, predictions,
+                           self.out_index, self.output_columns, n)
+
     @property
     def data(self):
         """fit data"""
@@ -223,6 +263,11 @@ class SubTransformer(object):
     """Sub-routine for fitting a pipeline
     """
 
+    __slots__ = [
+        'job', 'estimator', 'in_index', 'out_index', 'in_array', 'out_array',
+        'targets', 'index', 'transform_time_', 'path', 'verbose',
+        'cache_transforms', 'name', 'name_index', 'output_columns']
+
     def __init__(self, job, parent, estimator, in_index, in_array,
                  targets, index, out_index=None, out_array=None):
         self.job = job
@@ -238,9 +283,9 @@ class SubTransformer(object):
 
         self.path = parent._path
         self.verbose = parent.verbose
+        self.cache_transforms = parent.cache_transforms
         self.name = parent.cache_name
-        self.name_index = '.'.join(
-            [self.name] + [str(i) for i in index])
+        self.name_index = self.name + ''.join(['.%s' % i for i in index])
 
         if not parent.__no_output__:
             self.output_columns = parent.output_columns[index[0]]
@@ -282,7 +327,13 @@ class SubTransformer(object):
             self.in_array, self.targets, self.in_index)
 
         t0_f = time()
-        self.estimator.fit(xtemp, ytemp)
+        preprocessed = None
+        if self.cache_transforms:
+            # Transform the training set during the fit for reuse by
+            # learners fitted on the same fold
+            preprocessed = self.estimator.fit_transform(xtemp, ytemp)
+        else:
+            self.estimator.fit(xtemp, ytemp)
         self.transform_time_ = time() - t0_f
 
         if self.out_array is not None:
@@ -295,6 +346,9 @@ class SubTransformer(object):
                              out_index=self.out_index,
                              data=self.data)
         save(path, self.name_index, o)
+        if preprocessed is not None:
+            save(path, PREPROCESSED + '.' + self.name_index, preprocessed)
+
         if self.verbose:
             f = "stdout" if self.verbose < 10 else "stderr"
             msg = "{:<30} {}".format(self.name_index, "done")
@@ -312,6 +366,9 @@ class EvalSubLearner(SubLearner):
 
     sub-routine for cross-validated evaluation.
     """
+    __slots__ = ['error_score', 'train_score_', 'test_score_',
+                 'train_pred_time_', 'test_pred_time_']
+
     def __init__(self, job, parent, estimator, in_index, out_index,
                  in_array, targets, index):
 
@@ -399,16 +456,24 @@ class Cache(object):
     """Cache wrapper for IndexedEstimator
     """
 
-    def __init__(self, obj, path, verbose):
+    __slots__ = ['obj', 'path', 'name', 'verbose', 'in_array']
+
+    def __init__(self, obj, path, verbose, in_array=None):
         self.obj = obj
         self.path = path
         self.name = obj.name
         self.verbose = verbose
+        self.in_array = in_array
 
     def __call__(self, path=None):
         """Cache estimator to path"""
         path = path if path else self.path
         save(path, self.name, self.obj)
+        if self.in_array is not None:
+            # Transform the input once for all learners sharing the pipeline
+            xtemp, ytemp = slice_array(self.in_array, None, self.obj.out_index)
+            save(path, PREDICT_PREPROCESSED + '.' + self.name,
+                 self.obj.estimator.transform(xtemp, ytemp))
         if self.verbose:
             msg = "{:<30} {}".format(self.name, "cached")
             f = "stdout" if self.verbose < 10 - 3 else "stderr"
@@ -465,7 +530,6 @@ class BaseNode(OutputMixin, IndexMixin, BaseEstimator):
         """Caller for producing jobs"""
         job = args['job']
         self._path = args['dir']
-        _threading = self.backend == 'threading'
 
         if not self.__indexer__:
             raise NotInitializedError(
@@ -491,8 +555,7 @@ class BaseNode(OutputMixin, IndexMixin, BaseEstimator):
         if not parallel:
             return generator
 
-        parallel(delayed(subtask, not _threading)()
-                 for subtask in generator)
+        dispatch(parallel, generator)
 
         if self.__collect__:
             self.collect()
@@ -895,6 +958,13 @@ class Transformer(BaseNode):
         creates partitions, each partition needs to be mapped:
         ``{0: x, 1: x + 1}``.
 
+    cache_transforms : bool (default = False)
+        whether to cache the transformed training set of each fold during
+        fitting, and the transformed input data during prediction, so that
+        learners using the same pipeline do not re-apply it. Requires the
+        pipeline to return both ``X`` and ``y``. Increases the size of the
+        estimation cache.
+
     verbose : bool, int (default = False)
         whether to report completed fits.
 
@@ -904,12 +974,14 @@ class Transformer(BaseNode):
 
     __subtype__ = SubTransformer
 
-    def __init__(self, estimator, indexer=None, name=None, **kwargs):
+    def __init__(self, estimator, indexer=None, name=None,
+                 cache_transforms=False, **kwargs):
         assert_valid_pipeline(estimator)
         name = format_name(name, 'transformer', GLOBAL_TRANSFORMER_NAMES)
         super(Transformer, self).__init__(
             name=name, estimator=estimator, indexer=indexer, **kwargs)
         self.__no_output__ = True
+        self.cache_transforms = cache_transforms
 
     def _get_multiplier(self, X, y=None, alt=None):
         """Number of cols produced in prediction"""
@@ -917,9 +989,11 @@ class Transformer(BaseNode):
 
     def _gen_pred(self, job, X, P, generator):
         if self.__no_output__:
+            in_array = X if self.cache_transforms else None
+
             def gen():
                 for o in generator:
-                    yield Cache(o, self._path, self.verbose)
+                    yield Cache(o, self._path, self.verbose, in_array)
 
             return gen()
         else:
@@ -3,7 +3,170 @@
 Test base functions used by sublearners
 """
 import os
+import sys
+import shutil
+import tempfile
+import threading
 import numpy as np
-from mlens.parallel._base_functions import slice_array,  assign_predictions
+from mlens.parallel import ParallelProcessing, Learner
+from mlens.parallel import _base_functions
+from mlens.parallel._base_functions import (
+    slice_array,  assign_predictions, make_batches, expand_index, save,
+    prune_files, clear_index_cache, _INDEX_CACHE)
+from mlens.index import FoldIndex
+from mlens.utils.dummy import OLS
 
-# TODO: Write tests
+
+def test_make_batches():
+    """[Parallel | Base Functions] Test mini-batches of tasks"""
+    batches = list(make_batches(range(10), 1))
+    assert [len(b) for b in batches] == [2, 2, 2, 2, 2]
+    assert [t for b in batches for t in b] == list(range(10))
+
+    batches = list(make_batches(range(3), 4))
+    assert [len(b) for b in batches] == [1, 1, 1]
+
+    assert not list(make_batches([], 2))
+
+
+def test_expand_index():
+    """[Parallel | Base Functions] Test index expansion"""
+    assert expand_index(((0, 2), (2, 5)), 1) == slice(-1, 4)
+
+    idx = expand_index(((0, 2), (4, 6)))
+    np.testing.assert_array_equal(idx, [0, 1, 4, 5])
+    assert expand_index(((0, 2), (4, 6))) is idx
+    assert not idx.flags.writeable
+
+    idx = expand_index(((6, 9), (0, 2), (4, 5)), 2)
+    np.testing.assert_array_equal(idx, [4, 5, 6, -2, -1, 2])
+
+    # Indices above the memory bound are not cached
+    nbytes = _base_functions._INDEX_CACHE_NBYTES
+    _base_functions._INDEX_CACHE_NBYTES = 100
+    try:
+        idx = expand_index(((0, 1), (2, 100)))
+        assert expand_index(((0, 1), (2, 100))) is not idx
+    finally:
+        _base_functions._INDEX_CACHE_NBYTES = nbytes
+
+
+def test_expand_index_threads():
+    """[Parallel | Base Functions] Test index expansion from threads"""
+    errors = list()
+
+    def expand(i):
+        try:
+            for j in range(200):
+                idx = expand_index(((0, 2), (i + 3, i + 4 + j)))
+                assert idx[-1] == i + 3 + j
+        except Exception as exc:  # pylint: disable=broad-except
+            errors.append(exc)
+
+    # Small memory bound to force frequent evictions, and frequent thread
+    # switches to interleave cache updates
+    nbytes = _base_functions._INDEX_CACHE_NBYTES
+    _base_functions._INDEX_CACHE_NBYTES = 1e5
+    interval = getattr(sys, 'getswitchinterval', lambda: None)()
+    if interval is not None:
+        sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=expand, args=(i,))
+                   for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not errors
+        assert _base_functions._INDEX_CACHE_BYTES == sum(
+            [getattr(v, 'nbytes', 0) for v in _INDEX_CACHE.values()])
+        assert _base_functions._INDEX_CACHE_BYTES <= 1e5
+    finally:
+        if interval is not None:
+            sys.setswitchinterval(interval)
+        _base_functions._INDEX_CACHE_NBYTES = nbytes
+        clear_index_cache()
+
+    assert _base_functions._INDEX_CACHE_BYTES == 0
+
+
+def test_clear_index_cache():
+    """[Parallel | Base Functions] Test index cache is cleared after jobs"""
+    X, y = np.arange(40.).reshape(20, 2), np.arange(20.)
+    lr = Learner(OLS(), indexer=FoldIndex(4), name='lr')
+    with ParallelProcessing('threading', 2) as mgr:
+        mgr.map(lr, 'fit', X, y, return_preds=True)
+        assert _INDEX_CACHE
+    assert not _INDEX_CACHE
+
+
+def test_slice_array():
+    """[Parallel | Base Functions] Test slicing on index tuples"""
+    X = np.arange(20).reshape(10, 2)
+    y = np.arange(10)
+
+    x, z = slice_array(X, y, ((0, 2), (2, 4)))
+    assert np.shares_memory(x, X)
+    np.testing.assert_array_equal(z, y[:4])
+
+    x, z = slice_array(X, y, ((0, 2), (6, 8)))
+    np.testing.assert_array_equal(x, X[[0, 1, 6, 7]])
+    np.testing.assert_array_equal(z, y[[0, 1, 6, 7]])
+
+
+def test_assign_predictions():
+    """[Parallel | Base Functions] Test assigning predictions on index tuples"""
+    p = np.arange(8).reshape(4, 2)
+    P = np.zeros((6, 3))
+    assign_predictions(P, p, ((0, 2), (4, 6)), 1, 6)
+    np.testing.assert_array_equal(P[[0, 1, 4, 5], 1:], p)
+    np.testing.assert_array_equal(P[2:4], 0)
+
+    P = np.zeros((4, 2))
+    assign_predictions(P, p[:, 0], ((2, 4), (4, 6)), 1, 6)
+    np.testing.assert_array_equal(P[:, 1], p[:, 0])
+
+
+def test_prune_files():
+    """[Parallel | Base Functions] Test loading cache entries in order"""
+    path = tempfile.mkdtemp()
+    try:
+        for i in range(5):
+            save(path, 'est.0.%i' % i, np.arange(i))
+        save(path, 'other.0.0', None)
+
+        files = prune_files(path, 'est')
+        assert len(files) == 5
+        for i, f in enumerate(files):
+            np.testing.assert_array_equal(f, np.arange(i))
+    finally:
+        shutil.rmtree(path)
+
+
+def test_prune_files_threads():
+    """[Parallel | Base Functions] Test loading large cache entries in a pool"""
+    n_threads = _base_functions._N_LOAD_THREADS
+    nbytes = _base_functions._LOAD_THREADS_MIN_NBYTES
+    _base_functions._N_LOAD_THREADS = 2
+    _base_functions._LOAD_THREADS_MIN_NBYTES = 0
+
+    path = tempfile.mkdtemp()
+    try:
+        for i in range(5):
+            save(path, 'est.0.%i' % i, np.arange(i))
+
+        for _ in range(2):
+            files = prune_files(path, 'est')
+            for i, f in enumerate(files):
+                np.testing.assert_array_equal(f, np.arange(i))
+
+        # The pool is reused across calls
+        pool = _base_functions._LOAD_POOL
+        assert pool is not None
+        prune_files(path, 'est')
+        assert _base_functions._LOAD_POOL is pool
+    finally:
+        _base_functions._N_LOAD_THREADS = n_threads
+        _base_functions._LOAD_THREADS_MIN_NBYTES = nbytes
+        shutil.rmtree(path)
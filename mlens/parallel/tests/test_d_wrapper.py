@@ -2,9 +2,13 @@
 
 Test of the fit, predict and transform wrappers on the learners
 """
+import os
+import tempfile
 import numpy as np
 from mlens.testing import Data, EstimatorContainer
-from mlens.parallel import Group, Learner, Pipeline, run as _run
+from mlens.parallel import (Group, Layer, Learner, Transformer, Pipeline,
+                            ParallelProcessing, run as _run)
+from mlens.parallel.backend import MMAP_MIN_NBYTES
 from mlens.utils.dummy import OLS, Scale
 from mlens.externals.sklearn.base import clone
 
@@ -23,6 +27,26 @@ est = EstimatorContainer()
 def scorer(p, y): return np.mean(p - y)
 
 
+class PidOLS(OLS):
+
+    """OLS recording the id of the process it was fitted in"""
+
+    def fit(self, X, y):
+        self.pid_ = os.getpid()
+        return super(PidOLS, self).fit(X, y)
+
+
+class CountScale(Scale):
+
+    """Scale recording the number of calls to transform"""
+
+    calls = list()
+
+    def transform(self, X):
+        CountScale.calls.append(X.shape[0])
+        return super(CountScale, self).transform(X)
+
+
 data = Data('stack', False, True, True)
 X, y = data.get_data((25, 4), 3)
 (F, wf), (P, wp) = data.ground_truth(X, y,)
@@ -77,6 +101,47 @@ def test_data():
     assert 'score' in lr.data.__repr__()
 
 
+def test_persistent_pool():
+    """[Parallel | Learner] Test worker pool is shared across jobs"""
+    for backend in ['threading', 'multiprocessing']:
+        lr = Learner(OLS(), indexer=data.indexer, name='lr')
+        with ParallelProcessing(backend, 2) as mgr:
+            a = mgr.map(lr, 'fit', X, y, return_preds=True)
+            parallel = mgr._parallel
+            assert parallel is not None
+
+            b = mgr.map(lr, 'transform', X, return_preds=True)
+            assert mgr._parallel is parallel
+
+        assert mgr._parallel is None
+        np.testing.assert_array_equal(a, b)
+
+
+def test_persistent_pool_workers():
+    """[Parallel | Learner] Test jobs run on the same worker processes"""
+    lr = Learner(PidOLS(), indexer=data.indexer, name='lr')
+    pids = set()
+    with ParallelProcessing('multiprocessing', 2) as mgr:
+        for _ in range(2):
+            mgr.map(lr, 'fit', X, y)
+            pids.update([o.estimator.pid_ for o in lr.sublearners])
+
+    assert os.getpid() not in pids
+    assert len(pids) <= 2
+
+
+def test_memmap_threshold():
+    """[Parallel | Backend] Test only large inputs are memory-mapped"""
+    Z = np.zeros((int(MMAP_MIN_NBYTES) // 8 + 1, 1))
+    with ParallelProcessing('multiprocessing', 1) as mgr:
+        mgr.initialize('fit', X, y, None, stack=False, split=False)
+        assert not isinstance(mgr.job.predict_in, np.memmap)
+        mgr.clear()
+
+        mgr.initialize('fit', Z, y, None, stack=False, split=False)
+        assert isinstance(mgr.job.predict_in, np.memmap)
+
+
 def run(cls, job, eval=True):
     """Run a test"""
     if job == 'fit':
@@ -167,6 +232,91 @@ def test_run_fit():
     np.testing.assert_array_equal(A, F)
 
 
+def test_run_cache_transforms():
+    """[Parallel | Wrapper] test fit with cached auxiliary transforms"""
+    for path in [None, tempfile.mkdtemp]:
+        lr, tr = EstimatorContainer().get_learner('stack', False, True)
+        tr.cache_transforms = True
+        group = Group(learners=lr, transformers=tr, dtype=np.float64)
+
+        A = _run(group, 'fit', X, y, return_preds=True,
+                 path=path() if path else None)
+        np.testing.assert_array_equal(A, F)
+
+        A = _run(group, 'transform', X, path=path() if path else None)
+        np.testing.assert_array_equal(A, F)
+
+        A = _run(group, 'predict', X, path=path() if path else None)
+        np.testing.assert_array_equal(A, P)
+
+
+def test_run_cache_transforms_calls():
+    """[Parallel | Wrapper] test cached transforms are shared by learners"""
+    counts = dict()
+    for cache in [False, True]:
+        tr = Transformer(Pipeline(CountScale(), return_y=True),
+                         indexer=data.indexer, name='sc',
+                         cache_transforms=cache)
+        lrs = [Learner(OLS(), indexer=data.indexer, preprocess='sc',
+                       name='lr-%i' % i) for i in range(2)]
+        # Layer default does not override the transformer setting
+        layer = Layer(stack=Group(learners=lrs, transformers=tr))
+
+        del CountScale.calls[:]
+        with ParallelProcessing('threading', 2) as mgr:
+            mgr.map(layer, 'fit', X, y)
+            mgr.map(layer, 'predict', X)
+        counts[cache] = len(CountScale.calls)
+        assert tr.cache_transforms is cache
+
+    assert counts[True] < counts[False]
+
+
+def test_fit_cached_transforms_no_pipeline():
+    """[Parallel | Wrapper] test fit-only sublearner on cached transforms"""
+    lr = Learner(OLS(), indexer=data.indexer, preprocess='sc', name='lr')
+    lr.setup(X, y, 'fit')
+
+    Z, z = X[:10], y[:10]
+    for sub in lr.gen_fit(X, y):
+        assert sub.out_array is None
+
+        # The cache holds the transformed data but no pipeline to load
+        path = [(sub.preprocessed_index, (Z, z))]
+        sub.fit(path)
+        np.testing.assert_array_equal(sub.estimator.coef_,
+                                      OLS().fit(Z, z).coef_)
+
+
+def test_run_layer_threading():
+    """[Parallel | Wrapper] test threading layer in multiprocessing job"""
+    for backend in [None, 'threading']:
+        lr = Learner(PidOLS(), indexer=data.indexer, name='lr')
+        layer = Layer(stack=Group(learners=lr, transformers=[]),
+                      backend=backend)
+
+        with ParallelProcessing('multiprocessing', 2) as mgr:
+            mgr.map(layer, 'fit', X, y)
+
+        pids = [o.estimator.pid_ for o in lr.learner]
+        pids += [o.estimator.pid_ for o in lr.sublearners]
+        if backend is None:
+            # Inherits the manager's backend
+            assert os.getpid() not in pids
+        else:
+            assert set(pids) == {os.getpid()}
+
+
+def test_run_multiprocessing():
+    """[Parallel | Wrapper] test learner with default backend in processes"""
+    lr = Learner(PidOLS(), indexer=data.indexer, name='lr')
+    with ParallelProcessing('multiprocessing', 2) as mgr:
+        mgr.map(lr, 'fit', X, y)
+
+    pids = [o.estimator.pid_ for o in lr.sublearners]
+    assert os.getpid() not in pids
+
+
 def test_run_transform():
     """[Parallel | Wrapper] test transform with auxiliary"""
     lr, tr = EstimatorContainer().get_learner('stack', False, True)
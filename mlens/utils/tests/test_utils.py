@@ -11,6 +11,7 @@ import os
 import numpy as np
 import sysconfig
 import subprocess
+from threading import Timer
 from mlens import config
 from mlens.utils import utils
 from mlens.utils.exceptions import ParallelProcessingError
@@ -152,3 +153,28 @@ def test_load():
         np.testing.assert_raises(
             ParallelProcessingError,
             utils.load, os.path.join(os.getcwd(), 'nonexist'))
+
+
+def test_load_wait():
+    """[Utils] Check that load waits for a file being written"""
+    def save(obj, name):
+        utils.pickle_save(obj, name + '.tmp')
+        os.rename(name + '.tmp.pkl', name + '.pkl')
+
+    ivals = config.get_ivals()
+    config.set_ivals(2, 5)
+
+    f = os.path.join(os.getcwd(), 'delayed')
+    timer = Timer(0.05, save, args=('test', f))
+    timer.start()
+    try:
+        with open(os.devnull, 'w') as d, redirect_stderr(d):
+            t0 = time()
+            assert utils.load(f) == 'test'
+
+        # Picked up well before the check interval
+        assert time() - t0 < 1
+    finally:
+        timer.join()
+        os.remove(f + '.pkl')
+        config.set_ivals(*ivals)
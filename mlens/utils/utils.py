@@ -44,10 +44,10 @@ def pickled(name):
     return name
 
 
-def pickle_save(obj, name):
+def pickle_save(obj, name, protocol=None):
     """Utility function for pickling an object"""
     with open(pickled(name), 'wb') as f:
-        pickle.dump(obj, f)
+        pickle.dump(obj, f, protocol)
 
 
 def pickle_load(name):
@@ -58,25 +58,30 @@ def pickle_load(name):
 
 def load(file, enforce_filetype=True):
     """Utility exception handler for loading file"""
-    s, lim = get_ivals()
     if enforce_filetype:
         file = pickled(file)
     try:
         return pickle_load(file)
     except (EOFError, OSError, IOError) as exc:
         msg = str(exc)
+        s, lim = get_ivals()
         warnings.warn(
-            "Could not load transformer at %s. Will check every %.1f seconds "
-            "for %i seconds before aborting. " % (file, s, lim),
+            "Could not load transformer at %s. Will check with increasing "
+            "intervals of up to %.1f seconds for %i seconds before "
+            "aborting. " % (file, s, lim),
             ParallelProcessingWarning)
 
+        # Back off exponentially up to the check interval to pick up the
+        # file soon after it is written
         ts = time()
+        wait = min(s, 0.001)
         while not os.path.exists(file):
-            sleep(s)
+            sleep(wait)
+            wait = min(2 * wait, s)
             if time() - ts > lim:
                 raise ParallelProcessingError(
                     "Could not load transformer at %s\nDetails:\n%r" %
-                    (dir, msg))
+                    (file, msg))
 
         return pickle_load(file)
 